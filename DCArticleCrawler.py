@@ -1,22 +1,41 @@
 import os
+import re
 import json
 import datetime
 import time
+import asyncio
+import bisect
 import logging
-from typing import List, Set, Optional
+import queue
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Set, Optional, Tuple
+
+import aiohttp
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import requests
-import dataclasses
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import xxhash
 
-from DCArticleProcessor import DCArticleProcessor, ArticleData, make_url_for_article
+from DCArticleProcessor import (
+    DCArticleProcessor, ArticleData, make_url_template, parse_article_html,
+    BACKOFF_INITIAL, BACKOFF_CAP
+)
 
 
 # ====== Configuration ======
 DATE_FORMAT = "%Y.%m.%d"
+CHROMEDRIVER_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'dc-crawler', 'chromedriver_path')
+CHROMEDRIVER_MAX_AGE_DAYS = 7
+# Mobile board page: same list info as the desktop page in <10% of the bytes
+MOBILE_BOARD_URL = "https://m.dcinside.com/board/{gallery_id}"
 
 
 # ====== Logging Configuration ======
@@ -28,8 +47,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def index_path_for(jsonl_path: str) -> str:
+    """Path of the binary gall_no index kept alongside the JSONL file."""
+    return jsonl_path + '.idx'
+
+
 def load_collected_gall_no(articles_jsonl_file: str) -> Set[int]:
-    """Load collected article IDs (gall_no) from the JSONL file."""
+    """Load collected article IDs (gall_no) for duplicate checking.
+
+    Reads the compact binary sidecar index (8 bytes per id) when present,
+    so startup does not re-parse every JSON record. Falls back to scanning
+    the JSONL once and rebuilds the index for the next run."""
+    try:
+        with open(index_path_for(articles_jsonl_file), 'rb') as f:
+            ids = array('q')
+            ids.frombytes(f.read())
+        return set(ids)
+    except:
+        pass
 
     collected_gall_no: Set[int] = set()
     try:
@@ -40,17 +75,99 @@ def load_collected_gall_no(articles_jsonl_file: str) -> Set[int]:
                     collected_gall_no.add(int(article['gall_no']))
                 except json.JSONDecodeError:
                     continue
-        return collected_gall_no
     except:
         logger.warning(f"Failed to load collected IDs from {articles_jsonl_file}.")
         return set()
 
+    # Rebuild the sidecar index so the next startup skips the JSONL scan
+    if collected_gall_no:
+        try:
+            with open(index_path_for(articles_jsonl_file), 'wb') as f:
+                array('q', sorted(collected_gall_no)).tofile(f)
+        except OSError:
+            logger.warning(f"Failed to write index next to {articles_jsonl_file}.")
+    return collected_gall_no
+
+
+def hashes_path_for(jsonl_path: str) -> str:
+    """Path of the binary content-hash sidecar kept alongside the JSONL file."""
+    return jsonl_path + '.hashes'
+
+
+def content_hash(content: str) -> int:
+    """64-bit xxh3 hash of the article content, used for exact-dup detection."""
+    return xxhash.xxh3_64_intdigest(content.encode('utf-8'))
+
+
+def load_content_hashes(articles_jsonl_file: str) -> Set[int]:
+    """Load the content hashes of already saved articles.
+
+    Galleries are full of re-posts and bot spam where the same content
+    appears under many gall_no; storing one copy is enough. Reads the
+    binary sidecar when present, otherwise rebuilds it by hashing the
+    stored JSONL contents once."""
+    try:
+        with open(hashes_path_for(articles_jsonl_file), 'rb') as f:
+            hashes = array('Q')
+            hashes.frombytes(f.read())
+        return set(hashes)
+    except:
+        pass
+
+    content_hashes: Set[int] = set()
+    try:
+        with open(articles_jsonl_file, 'rb') as f:
+            for line in f:
+                try:
+                    article = orjson.loads(line)
+                    if article.get('content'):
+                        content_hashes.add(content_hash(article['content']))
+                except orjson.JSONDecodeError:
+                    continue
+    except:
+        logger.warning(f"Failed to load content hashes from {articles_jsonl_file}.")
+        return set()
+
+    if content_hashes:
+        try:
+            with open(hashes_path_for(articles_jsonl_file), 'wb') as f:
+                array('Q', sorted(content_hashes)).tofile(f)
+        except OSError:
+            logger.warning(f"Failed to write content hashes next to {articles_jsonl_file}.")
+    return content_hashes
+
+
+def merge_collected_ranges(collected_gall_no: Set[int]) -> List[Tuple[int, int]]:
+    """Compress the collected ids into sorted (start, end) runs of
+    consecutive gall_no, so resumed crawls can jump over whole blocks
+    instead of stepping through them one id at a time."""
+    ranges: List[Tuple[int, int]] = []
+    for gall_no in sorted(collected_gall_no):
+        if ranges and gall_no == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], gall_no)
+        else:
+            ranges.append((gall_no, gall_no))
+    return ranges
+
+
+def prev_uncollected(gall_no: int, collected_ranges: List[Tuple[int, int]]) -> int:
+    """First gall_no at or below the given one outside any collected run."""
+    i = bisect.bisect_left(collected_ranges, (gall_no + 1,)) - 1
+    if i >= 0 and collected_ranges[i][0] <= gall_no <= collected_ranges[i][1]:
+        return collected_ranges[i][0] - 1
+    return gall_no
+
 
 def save_data_in_batch(
     jsonl_path: str,
-    batch: List[ArticleData]
+    batch: List[ArticleData],
+    content_hashes: Optional[Set[int]] = None
 ) -> None:
     """Save the batch of articles to JSONL file.
+
+    When content_hashes is given, articles whose content exactly matches an
+    already saved one (crossposts, bot spam) are dropped; their gall_no is
+    still recorded so they are not refetched on resume.
     
     The articles will be saved in the following format:
     {
@@ -69,23 +186,68 @@ def save_data_in_batch(
         ]
     }
     """
-    os.makedirs(os.path.dirname(jsonl_path), exist_ok=True)
-    with open(jsonl_path, 'a', encoding='utf-8') as f:
-        for article in batch:
-            # Convert datetime to string format
-            if isinstance(article.date, datetime.datetime):
-                article.date = article.date.strftime(DATE_FORMAT)
-            
-            # Ensure all numeric fields are converted to proper type
-            article.gall_no = int(article.gall_no)
-            article.view_count = int(article.view_count)
-            article.recommend_count = int(article.recommend_count)
-            article.nonrecommend_count = int(article.nonrecommend_count)
-            # Remove header field from article data
-            article_dict = dataclasses.asdict(article)
-            article_dict.pop('header', None)
-            json.dump(article_dict, f, ensure_ascii=False)
-            f.write('\n')
+    lines = []
+    new_hashes = array('Q')
+    for article in batch:
+        if content_hashes is not None and article.content:
+            h = content_hash(article.content)
+            if h in content_hashes:
+                logger.info(f"Article {article.gall_no} duplicates already saved content. Skipping...")
+                continue
+            content_hashes.add(h)
+            new_hashes.append(h)
+
+        # Convert datetime to string format
+        if isinstance(article.date, datetime.datetime):
+            article.date = article.date.strftime(DATE_FORMAT)
+
+        lines.append(orjson.dumps(article.to_record(), option=orjson.OPT_APPEND_NEWLINE))
+    if not batch:
+        return
+
+    if lines:
+        with open(jsonl_path, 'ab', buffering=1 << 20) as f:
+            f.write(b''.join(lines))
+
+    # Append the new ids and hashes to the sidecar files in the same flush;
+    # dropped duplicates keep their id so resumes do not refetch them
+    with open(index_path_for(jsonl_path), 'ab') as f:
+        array('q', [article.gall_no for article in batch]).tofile(f)
+    if new_hashes:
+        with open(hashes_path_for(jsonl_path), 'ab') as f:
+            new_hashes.tofile(f)
+
+
+class DriverPool:
+    """Pool of warm Chrome drivers keyed to worker threads.
+
+    Each worker thread gets its own driver on first acquire and keeps
+    reusing it, so the browser cold start is paid once per worker instead
+    of once per article. Drivers are only started when a thread actually
+    needs the Selenium fallback. close() quits every driver started."""
+
+    def __init__(self, factory: Callable[[], webdriver.Chrome]):
+        self._factory = factory
+        self._local = threading.local()
+        self._drivers: List[webdriver.Chrome] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> webdriver.Chrome:
+        """Return this thread's driver, starting one on first use."""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = self._factory()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def close(self) -> None:
+        """Quit every driver the pool has started."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            driver.quit()
 
 
 """Crawl and save articles using DCArticleProcessor"""
@@ -103,10 +265,16 @@ class DCArticleCrawler:
                  excluded_heads: Optional[List[str]] = None,
                  is_headless: bool = True,
                  maximum_batch_size: int = 100,
+                 max_concurrency: int = 5,
+                 driver_pool_size: int = 2,
                  jsonl_path: Optional[str] = None):
 
         self.gallery_id = gallery_id
         self.gall_type = gall_type
+        # Bind gallery type and id once; per-article URLs are a single
+        # % substitution, and the list-page URL munging happens only here
+        self._url_tmpl = make_url_template(gall_type, gallery_id)
+        self._list_url = (self._url_tmpl % 1).replace('&no=1', '').replace('view', 'lists')
 
         self.start_gall_no = start_gall_no
         self.end_gall_no = end_gall_no
@@ -122,17 +290,57 @@ class DCArticleCrawler:
         self.is_headless = is_headless
 
         self.maximum_batch_size = maximum_batch_size
+        self.max_concurrency = max_concurrency
+        self.driver_pool_size = driver_pool_size
         self.jsonl_path = jsonl_path
+        if self.jsonl_path is not None:
+            # Create the output directory once instead of on every batch flush
+            os.makedirs(os.path.dirname(self.jsonl_path), exist_ok=True)
 
-        self.driver = self._init_driver()
+        self._recent_gall_no: Optional[int] = None
+        self.driver_pool = DriverPool(self._init_driver)
         self.headers = {'User-Agent' : 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)AppleWebKit/537.36 (KHTML, like Gecko) Chrome/73.0.3683.86 Safari/537.36'}
+        self.session = self._init_session()
+
+    def _init_session(self) -> requests.Session:
+        """Initialize a pooled HTTP session shared by all article requests.
+
+        Reusing one session keeps connections to gall.dcinside.com alive,
+        avoiding a new TCP + TLS handshake per article."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        # 429/503 are handled adaptively by request_with_backoff; the adapter
+        # only retries the remaining transient 5xx
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 504])
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+        return session
     
     def check_gallery_conditions(self):
-        """Check if the current gallery meets the conditions."""
-        url_for_check = make_url_for_article(gallery_type=self.gall_type, gallery_id=self.gallery_id, gall_no=1)
-        url_for_check = url_for_check.replace('&no=1', '').replace('view', 'lists')
-        
-        response = requests.get(url_for_check, headers=self.headers)
+        """Check if the current gallery exists, remembering its most recent
+        gall_no along the way.
+
+        Probes the mobile board page first: it answers both the existence
+        check and the recent-post lookup from one small response. Falls
+        back to the desktop list page when the mobile page is unusable."""
+        self._recent_gall_no = None
+
+        mobile_url = MOBILE_BOARD_URL.format(gallery_id=self.gallery_id)
+        try:
+            response = self.session.get(mobile_url, timeout=10)
+        except requests.RequestException:
+            response = None
+
+        if response is not None and response.status_code == 200:
+            # Article links on the mobile page look like /board/<id>/<no>
+            post_nos = re.findall(rf'/board/{re.escape(self.gallery_id)}/(\d+)'.encode('ascii'),
+                                  response.content)
+            if post_nos:
+                # Notices keep their old (small) numbers, so max is the
+                # newest regular post
+                self._recent_gall_no = max(int(post_no) for post_no in post_nos)
+                return
+
+        response = self.session.get(self._list_url, timeout=10)
         if response.status_code == 404:
             raise ValueError(f"Gallery {self.gallery_id} with gall_type {self.gall_type} does not exist.")
 
@@ -193,22 +401,192 @@ class DCArticleCrawler:
             
             if self.start_date > self.end_date:
                 raise ValueError("`start_date` must be less than or equal to `end_date`.")
+            elif self._recent_gall_no is not None:
+                # Already learned from the mobile probe in check_gallery_conditions
+                self.gall_no = self._recent_gall_no
+                self.crawl_article_based_on_gall_no = False
             else:
-                temp_url_for_initial_gall_no = make_url_for_article(gallery_type=self.gall_type, gallery_id=self.gallery_id, gall_no=1)
-                temp_url_for_initial_gall_no = temp_url_for_initial_gall_no.replace('&no=1', '').replace('view', 'lists')
-                temp_data = requests.get(temp_url_for_initial_gall_no, headers=self.headers)
+                temp_data = self.session.get(self._list_url, timeout=10)
                 temp_soup = BeautifulSoup(temp_data.text, 'html.parser')
                 recent_gall_no = self.select_recent_gall_no(temp_soup)
                 self.gall_no = recent_gall_no
                 self.crawl_article_based_on_gall_no = False
 
+    async def _fetch_article_html(self,
+                                  session: aiohttp.ClientSession,
+                                  semaphore: asyncio.Semaphore,
+                                  gall_no: int):
+        """Fetch one article view page, bounded by the shared semaphore."""
+        url = self._url_tmpl % gall_no
+        delay = BACKOFF_INITIAL
+        async with semaphore:
+            while True:
+                try:
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        if response.status in (429, 503):
+                            # Server is throttling: honor Retry-After or back
+                            # off exponentially up to the cap
+                            retry_after = response.headers.get('Retry-After')
+                            if retry_after is not None and retry_after.isdigit():
+                                wait = min(float(retry_after), BACKOFF_CAP)
+                            else:
+                                wait = delay
+                            if delay >= BACKOFF_CAP:
+                                logger.warning(f"Still throttled ({response.status}) on article {gall_no}. Giving up.")
+                                return gall_no, None
+                            logger.warning(f"Server throttled ({response.status}) on article {gall_no}. Backing off {wait:.1f}s...")
+                            await asyncio.sleep(wait)
+                            delay = min(delay * 2, BACKOFF_CAP)
+                            continue
+                        html = await response.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error(f"Failed to fetch article data {gall_no}: {e}")
+                    return gall_no, None
+                # Fixed sleep stays only as a politeness floor between requests
+                await asyncio.sleep(self.sleep_between_requests)
+                return gall_no, html
+
+    async def _fetch_articles_async(self, gall_nos: List[int]):
+        """Fetch the given gall_nos concurrently with bounded parallelism."""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            return await asyncio.gather(
+                *(self._fetch_article_html(session, semaphore, gall_no) for gall_no in gall_nos)
+            )
+
+    def _crawl_gall_no_range_async(self, collected_gall_no: Set[int]):
+        """Crawl the metadata-only gall_no range through the async pipeline.
+
+        Fetches run concurrently per batch; the returned HTML blobs are
+        parsed in a worker-process pool, since parsing is CPU-bound and the
+        GIL keeps threads from scaling it. Selenium is not involved here,
+        it is only needed for the comments branch."""
+        gall_nos = [gall_no for gall_no in range(self.gall_no, self.end_gall_no + 1)
+                    if gall_no not in collected_gall_no]
+        skipped = (self.end_gall_no - self.gall_no + 1) - len(gall_nos)
+        if skipped > 0:
+            logger.info(f"Skipping {skipped} already collected articles.")
+
+        parse_workers = max(1, (os.cpu_count() or 2) - 1)
+        with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+            for i in range(0, len(gall_nos), self.maximum_batch_size):
+                results = asyncio.run(self._fetch_articles_async(gall_nos[i:i + self.maximum_batch_size]))
+                fetched = [(gall_no, html) for gall_no, html in results if html is not None]
+                # chunksize amortizes the pickling round-trip per worker task
+                for article_meta in executor.map(parse_article_html,
+                                                 [gall_no for gall_no, _ in fetched],
+                                                 [html for _, html in fetched],
+                                                 chunksize=16):
+                    if article_meta is None:
+                        continue
+                    self._batch.append(ArticleData(
+                        gall_no=article_meta.gall_no,
+                        date=article_meta.date,
+                        header=article_meta.header,
+                        title=article_meta.title,
+                        content=article_meta.content,
+                        view_count=article_meta.view_count,
+                        recommend_count=article_meta.recommend_count,
+                        nonrecommend_count=article_meta.nonrecommend_count,
+                        comments=[]
+                    ))
+                    logger.info(f"Collected article {article_meta.gall_no}.")
+                self._batch = self._flush_batch(self._batch)
+
+    def _writer_loop(self):
+        """Consume batches from the writer queue and append them to disk.
+
+        Runs on a daemon thread so the crawl loop never stalls on a
+        flush; the queue's maxsize provides backpressure if disk cannot
+        keep up."""
+        while True:
+            batch = self._writer_q.get()
+            try:
+                save_data_in_batch(self.jsonl_path, batch, self.content_hashes)
+                logger.info(f"Saved {len(batch)} articles to {self.jsonl_path}.")
+            except Exception as e:
+                logger.error(f"Failed to save batch of {len(batch)} articles: {e}")
+            finally:
+                self._writer_q.task_done()
+
+    def _flush_batch(self, batch: List[ArticleData]) -> List[ArticleData]:
+        """Hand the filled batch to the background writer, return a new one."""
+        if batch:
+            self._writer_q.put(batch)
+        return []
+
+    def _process_article_with_comments(self, gall_no: int) -> Optional[ArticleData]:
+        """Process one article including comments; runs on a worker thread."""
+        logger.info(f"Processing article {gall_no}...")
+        article_processor = DCArticleProcessor(
+            gallery_id=self.gallery_id,
+            gall_type=self.gall_type,
+            gall_no=gall_no,
+            headers=self.headers,
+            session=self.session,
+            is_crawl_comments=True,
+            refresh_time_for_comment=self.refresh_time_for_comment,
+            driver_factory=self._get_driver
+        )
+        article_data = article_processor.process_article()
+        if article_data is not None:
+            logger.info(f"Collected article {gall_no}.")
+        time.sleep(self.sleep_between_requests)
+        return article_data
+
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return the calling thread's Selenium driver from the pool.
+
+        With comments served by the AJAX endpoint, most runs never fall
+        back to Selenium, so the browser cold-start is paid only when
+        actually needed."""
+        return self.driver_pool.acquire()
+
+    def _resolve_chromedriver_path(self) -> str:
+        """Find a chromedriver without asking the network on every run.
+
+        ChromeDriverManager().install() checks the latest release online
+        each call, a multi-second pre-roll on resumed crawls. Honor an
+        explicit DC_CHROMEDRIVER_PATH first, then a cached path younger
+        than CHROMEDRIVER_MAX_AGE_DAYS, and only then go through
+        webdriver-manager (caching the result)."""
+        env_path = os.environ.get('DC_CHROMEDRIVER_PATH')
+        if env_path and os.path.exists(env_path):
+            return env_path
+
+        try:
+            age = time.time() - os.path.getmtime(CHROMEDRIVER_CACHE)
+            if age < CHROMEDRIVER_MAX_AGE_DAYS * 86400:
+                with open(CHROMEDRIVER_CACHE, 'r', encoding='utf-8') as f:
+                    cached_path = f.read().strip()
+                if cached_path and os.path.exists(cached_path):
+                    return cached_path
+        except OSError:
+            pass
+
+        driver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE), exist_ok=True)
+            with open(CHROMEDRIVER_CACHE, 'w', encoding='utf-8') as f:
+                f.write(driver_path)
+        except OSError:
+            logger.warning("Failed to cache the chromedriver path.")
+        return driver_path
+
     def _init_driver(self) -> webdriver.Chrome:
         """Initialize the Selenium WebDriver."""
-        service = Service(ChromeDriverManager().install())
+        service = Service(self._resolve_chromedriver_path())
         options = webdriver.ChromeOptions()
         if self.is_headless:
             # No Browser UI if headless
             options.add_argument('--headless')
+        # Scraping needs no images, extensions or GPU: cut per-page work
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--blink-settings=imagesEnabled=false')
         driver = webdriver.Chrome(service=service, options=options)
         timeout_for_page_load = 10
         driver.set_page_load_timeout(timeout_for_page_load)
@@ -223,8 +601,13 @@ class DCArticleCrawler:
         # e.g. gall_no range or date range
         self.check_scrapping_conditions()
         
-        # Collected gall_no for checking duplicates
+        # Collected gall_no for checking duplicates, plus the same ids
+        # compressed into consecutive runs for fast skipping
         collected_gall_no = load_collected_gall_no(self.jsonl_path)
+        collected_ranges = merge_collected_ranges(collected_gall_no)
+
+        # Content hashes of saved articles, for skipping exact re-posts
+        self.content_hashes = load_content_hashes(self.jsonl_path)
         
         logger.info(f"Initialized DCArticleCrawler for {self.gallery_id} with gall_type {self.gall_type}.")
         if self.start_gall_no is not None:
@@ -232,68 +615,56 @@ class DCArticleCrawler:
         else:
             logger.info(f"start date: {self.start_date}, end date: {self.end_date}.")
 
-        batch = []
-        
+        # Background writer: disk flushes no longer stall the crawl loop
+        self._writer_q: queue.Queue = queue.Queue(maxsize=4)
+        threading.Thread(target=self._writer_loop, daemon=True, name='batch-writer').start()
+
+        self._batch = []
+
         try:
             if self.crawl_article_based_on_gall_no is True:
                 logger.info("Crawling articles based on gall_no range.")
-                # Crawl articles based on gall_no range
-                while self.gall_no <= self.end_gall_no:
-                    if self.gall_no in collected_gall_no:
-                        logger.info(f"Article {self.gall_no} already collected. Skipping...")
-                        self.gall_no += 1
-                        continue
-                    
-                    if self.is_crawl_comments is True:
-                        article_processor = DCArticleProcessor(
-                            gallery_id=self.gallery_id,
-                            gall_type=self.gall_type,
-                            gall_no=self.gall_no,
-                            headers=self.headers,
-                            is_crawl_comments=True,
-                            refresh_time_for_comment=self.refresh_time_for_comment,
-                            driver=self.driver
-                        )
-                    else:
-                        article_processor = DCArticleProcessor(
-                            gallery_id=self.gallery_id,
-                            gall_type=self.gall_type,
-                            gall_no=self.gall_no,
-                            headers=self.headers,
-                            is_crawl_comments=False,
-                            refresh_time_for_comment=self.refresh_time_for_comment,
-                            driver=self.driver
-                        )
-                    logger.info(f"Processing article {self.gall_no}...")
+                if self.is_crawl_comments is False:
+                    # Pure metadata fetches are I/O-bound: run them concurrently
+                    self._crawl_gall_no_range_async(collected_gall_no)
+                    return
+                # Crawl articles based on gall_no range, a few workers at a
+                # time; each worker reuses its own warm driver from the pool
+                # when the Selenium fallback is needed
+                gall_nos = [gall_no for gall_no in range(self.gall_no, self.end_gall_no + 1)
+                            if gall_no not in collected_gall_no]
+                skipped = (self.end_gall_no - self.gall_no + 1) - len(gall_nos)
+                if skipped > 0:
+                    logger.info(f"Skipping {skipped} already collected articles.")
 
-                    article_data: Optional[ArticleData] = article_processor.process_article()
-                    # logger.info(f"article_data: {article_data}")
-                    if article_data is not None:
-                        batch.append(article_data)
-                        logger.info(f"Collected article {self.gall_no}.")
-                    
-                    if len(batch) >= self.maximum_batch_size:
-                        save_data_in_batch(self.jsonl_path, batch)
-                        logger.info(f"Saved {len(batch)} articles to {self.jsonl_path}.")
-                        batch.clear()
-                    
-                    self.gall_no += 1
-                    time.sleep(self.sleep_between_requests)
-                save_data_in_batch(self.jsonl_path, batch)
-                logger.info(f"Saved {len(batch)} articles to {self.jsonl_path}.")
-                batch.clear()
+                with ThreadPoolExecutor(max_workers=self.driver_pool_size) as executor:
+                    for i in range(0, len(gall_nos), self.maximum_batch_size):
+                        chunk = gall_nos[i:i + self.maximum_batch_size]
+                        for article_data in executor.map(self._process_article_with_comments, chunk):
+                            if article_data is not None:
+                                self._batch.append(article_data)
+                        self._batch = self._flush_batch(self._batch)
             else:
                 logger.info("Crawling articles based on date range.")
                 
                 while True:
+                    if self.gall_no in collected_gall_no:
+                        # Jump below the whole contiguous collected run before
+                        # paying for a fetch
+                        prev_gall_no = prev_uncollected(self.gall_no, collected_ranges)
+                        logger.info(f"Articles {prev_gall_no + 1}-{self.gall_no} already collected. Skipping...")
+                        self.gall_no = prev_gall_no
+                        continue
+
                     article_processor = DCArticleProcessor(
                         gallery_id=self.gallery_id,
                         gall_type=self.gall_type,
                         gall_no=self.gall_no,
                         headers=self.headers,
+                        session=self.session,
                         is_crawl_comments=False,
                         refresh_time_for_comment=self.refresh_time_for_comment,
-                        driver=self.driver
+                        driver_factory=self._get_driver
                     )
                     article_data: Optional[ArticleData] = article_processor.process_article()
                     if article_data is None:
@@ -302,32 +673,18 @@ class DCArticleCrawler:
                     
                     # Check if the article date is within the specified range
                     if self.start_date <= article_data.date <= self.end_date:
-                        if self.gall_no in collected_gall_no:
-                            logger.info(f"Article {self.gall_no} already collected. Skipping...")
-                        else:
-                            logger.info(f"Processing article {self.gall_no}...")
-                            if self.is_crawl_comments is False:
-                                # If not crawling comments, we can directly append the article data
-                                batch.append(article_data)
-                            else:
-                                # If crawling comments, we need to process the article again with crawling comments
-                                article_processor = DCArticleProcessor(
-                                    gallery_id=self.gallery_id,
-                                    gall_type=self.gall_type,
-                                    gall_no=self.gall_no,
-                                    headers=self.headers,
-                                    is_crawl_comments=True,
-                                    refresh_time_for_comment=self.refresh_time_for_comment,
-                                    driver=self.driver
-                                )
-                                article_data = article_processor.process_article()
-                                batch.append(article_data)
+                        logger.info(f"Processing article {self.gall_no}...")
+                        if self.is_crawl_comments is True:
+                            # Reuse the page already fetched for the date
+                            # check; only the comments are fetched on top
+                            article_processor.is_crawl_comments = True
+                            article_data = article_processor.attach_comments(article_data)
+                        if article_data is not None:
+                            self._batch.append(article_data)
                             logger.info(f"Collected article {self.gall_no}.")
-                            
-                            if len(batch) >= self.maximum_batch_size:
-                                save_data_in_batch(self.jsonl_path, batch)
-                                logger.info(f"Saved {len(batch)} articles to {self.jsonl_path}.")
-                                batch.clear()
+
+                        if len(self._batch) >= self.maximum_batch_size:
+                            self._batch = self._flush_batch(self._batch)
                     elif article_data.date > self.end_date:
                         logger.info(f"Article {self.gall_no} is after the specified end date.")
                     elif article_data.date < self.start_date:
@@ -336,12 +693,13 @@ class DCArticleCrawler:
                     
                     self.gall_no -= 1
                     time.sleep(self.sleep_between_requests)
-                save_data_in_batch(self.jsonl_path, batch)
-                logger.info(f"Saved {len(batch)} articles to {self.jsonl_path}.")
-                batch.clear()
+                self._batch = self._flush_batch(self._batch)
         except KeyboardInterrupt:
-            save_data_in_batch(self.jsonl_path, batch)
-            logger.info(f"Saved {len(batch)} articles to {self.jsonl_path}.")
-            batch.clear()
+            logger.info("Interrupted. Flushing collected articles...")
         finally:
-            self.driver.quit()
+            # Hand the remaining batch to the writer and wait for the queue
+            # to drain before tearing anything down
+            self._batch = self._flush_batch(self._batch)
+            self._writer_q.join()
+            self.driver_pool.close()
+            self.session.close()
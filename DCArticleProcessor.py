@@ -1,20 +1,76 @@
 import datetime
-from typing import List, Dict, Optional, Union
+import re
+import time
+from typing import Callable, List, Dict, Optional, Union
 import logging
 
 from dataclasses import dataclass
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from bs4 import BeautifulSoup
 from bs4 import Tag
+import soupsieve
 import requests
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # selectolax is optional; we fall back to BeautifulSoup below
+    HTMLParser = None
+
+try:
+    BeautifulSoup('', 'lxml')
+    BS4_PARSER = 'lxml'
+except Exception:
+    BS4_PARSER = 'html.parser'
+
+# The class selectors are unique on the view page, so no container chains
+# are needed
+SEL_DATE = 'span.gall_date'
+SEL_HEADER = 'span.title_headtext'
+SEL_TITLE = 'span.title_subject'
+SEL_CONTENT = 'div.write_div'
+SEL_VIEW_COUNT = 'span.gall_count'
+
+# Compiled once at import: soupsieve re-tokenizes selector strings on every
+# select_one call otherwise
+_SS_DATE = soupsieve.compile(SEL_DATE)
+_SS_HEADER = soupsieve.compile(SEL_HEADER)
+_SS_TITLE = soupsieve.compile(SEL_TITLE)
+_SS_CONTENT = soupsieve.compile(SEL_CONTENT)
+_SS_VIEW_COUNT = soupsieve.compile(SEL_VIEW_COUNT)
+
 
 # ====== Configuration ======
 DATE_FORMAT = "%Y.%m.%d"
+COMMENT_API_URL = "https://gall.dcinside.com/board/comment/"
+GALLTYPE_CODE = {'main': 'G', 'minor': 'M', 'mini': 'MI'}
+
+# Exponential backoff bounds used when the server throttles us (429/503)
+BACKOFF_INITIAL = 0.1
+BACKOFF_CAP = 10.0
+
+# e_s_n_o is the hidden anti-CSRF token embedded in every view page
+# (bytes pattern: the page body is scanned before any decoding)
+_ESNO_RE = re.compile(rb'name="e_s_n_o"[^>]*value="([^"]*)"')
+# Comment bodies from the AJAX endpoint arrive as HTML fragments
+_TAG_RE = re.compile(r'<[^>]+>')
+# App signatures appended to contents/comments, removed in one pass
+_SCRUB_RE = re.compile(r'- dc official App|- dc App')
+
+# Resolves true the moment a comment node appears in the DOM, or false
+# after the given timeout; avoids fixed-interval polling and refreshes
+_COMMENT_WAIT_JS = """
+const timeoutMs = arguments[0];
+const cb = arguments[arguments.length - 1];
+const sel = "ul.cmt_list li[id^='comment_li_'] p.usertxt.ub-word";
+if (document.querySelector(sel)) return cb(true);
+const mo = new MutationObserver(() => {
+    if (document.querySelector(sel)) { mo.disconnect(); cb(true); }
+});
+mo.observe(document.body, {childList: true, subtree: true});
+setTimeout(() => { mo.disconnect(); cb(false); }, timeoutMs);
+"""
 
 
 # ====== Logging Configuration ======
@@ -36,20 +92,38 @@ def parse_date(text: str) -> Optional[datetime.datetime]:
         return None
 
 
+URL_TEMPLATES = {
+    'main': "https://gall.dcinside.com/board/view/?id={gallery_id}&no=%d",
+    'minor': "https://gall.dcinside.com/mgallery/board/view/?id={gallery_id}&no=%d",
+    'mini': "https://gall.dcinside.com/mini/board/view/?id={gallery_id}&no=%d",
+}
+
+
+def make_url_template(gallery_type: str, gallery_id: str) -> str:
+    """Pre-bind gallery type and id into a '%d'-style article URL template.
+
+    Resolving the type branch once per crawler leaves a single %
+    substitution per article."""
+    try:
+        return URL_TEMPLATES[gallery_type].format(gallery_id=gallery_id)
+    except KeyError:
+        raise ValueError("Invalid gallery type. Must be 'main', 'minor', or 'mini'.")
+
+
 def make_url_for_article(gallery_type: str, gallery_id: str, gall_no: int) -> str:
-        """Constructs the URL for the article based on gallery type and number."""
-        if gallery_type == 'main':
-            return f"https://gall.dcinside.com/board/view/?id={gallery_id}&no={gall_no}"
-        elif gallery_type == 'minor':
-            return f"https://gall.dcinside.com/mgallery/board/view/?id={gallery_id}&no={gall_no}"
-        elif gallery_type == 'mini':
-            return f"https://gall.dcinside.com/mini/board/view/?id={gallery_id}&no={gall_no}"
-        else:
-            raise ValueError("Invalid gallery type. Must be 'main', 'minor', or 'mini'.")
+    """Constructs the URL for the article based on gallery type and number."""
+    return make_url_template(gallery_type, gallery_id) % gall_no
 
 
+# __slots__ drops the per-instance __dict__; with 100-article batches and
+# long comment lists that is measurable allocator traffic. Declared by
+# hand because dataclass(slots=True) needs Python 3.10 and the README
+# promises 3.7.
 @dataclass
 class ArticleExceptComment:
+    __slots__ = ('gall_no', 'date', 'header', 'title', 'view_count',
+                 'content', 'recommend_count', 'nonrecommend_count')
+
     gall_no: int
     date: datetime.datetime
     header: str
@@ -59,11 +133,19 @@ class ArticleExceptComment:
     recommend_count: int
     nonrecommend_count: int
 
+    def __post_init__(self):
+        # Normalize numeric fields scraped as strings, so the save path
+        # is pure serialization
+        self.gall_no = int(self.gall_no)
+        self.view_count = int(self.view_count)
+        self.recommend_count = int(self.recommend_count)
+        self.nonrecommend_count = int(self.nonrecommend_count)
+
 
 @dataclass
 class ArticleData(ArticleExceptComment):
     """ArticleData extends ArticleExceptComment by adding comments field.
-    
+
     comments structure example:
     [
         {
@@ -72,8 +154,186 @@ class ArticleData(ArticleExceptComment):
         }
     ]
     """
+    __slots__ = ('comments',)
+
     comments: List[Dict[str, Union[str, List[str]]]]
 
+    def to_record(self) -> Dict[str, Union[str, int, list]]:
+        """Shallow dict of the persisted fields, in save order.
+
+        Replaces dataclasses.asdict, which deep-copies every field; the
+        header field is not persisted."""
+        return {
+            'gall_no': self.gall_no,
+            'date': self.date,
+            'title': self.title,
+            'view_count': self.view_count,
+            'content': self.content,
+            'recommend_count': self.recommend_count,
+            'nonrecommend_count': self.nonrecommend_count,
+            'comments': self.comments
+        }
+
+
+def request_with_backoff(session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+    """Issue a request, backing off while the server is throttling us.
+
+    Retries 429/503 responses, honoring Retry-After when present and
+    otherwise doubling the wait from BACKOFF_INITIAL up to BACKOFF_CAP.
+    Once the cap is reached the throttled response is returned as-is so
+    the caller can treat it as a failure. Other statuses and transport
+    errors are the caller's business."""
+    delay = BACKOFF_INITIAL
+    while True:
+        response = session.request(method, url, **kwargs)
+        if response.status_code not in (429, 503):
+            return response
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            wait = min(float(retry_after), BACKOFF_CAP)
+        else:
+            wait = delay
+        if delay >= BACKOFF_CAP:
+            logger.warning(f"Still throttled ({response.status_code}) on {url}. Giving up.")
+            return response
+        logger.warning(f"Server throttled ({response.status_code}) on {url}. Backing off {wait:.1f}s...")
+        time.sleep(wait)
+        delay = min(delay * 2, BACKOFF_CAP)
+
+
+def extract_esno(html: bytes) -> Optional[str]:
+    """Extract the e_s_n_o token from the raw article view page HTML."""
+    match = _ESNO_RE.search(html)
+    return match.group(1).decode('ascii') if match else None
+
+
+def parse_article_html(gall_no: int, html: Union[str, bytes]) -> Optional[ArticleExceptComment]:
+    """Parse the article view page HTML into ArticleExceptComment.
+
+    Kept as a module-level function so both the synchronous processor and
+    the async fetch pipeline in DCArticleCrawler can share it. Uses the
+    C-backed selectolax parser when available and falls back to
+    BeautifulSoup otherwise. Accepts the raw response bytes so the whole
+    body is never decoded into one big Python str; only the leaf text
+    nodes that are actually extracted become strings."""
+    if HTMLParser is not None:
+        try:
+            return _parse_article_selectolax(gall_no, html)
+        except Exception as e:
+            logger.warning(f"selectolax failed on article {gall_no} ({e}). Falling back to BeautifulSoup.")
+    return _parse_article_bs4(gall_no, html)
+
+
+def _parse_article_selectolax(gall_no: int, html: Union[str, bytes]) -> Optional[ArticleExceptComment]:
+    """selectolax implementation of parse_article_html.
+
+    The class selectors (gall_date, title_subject, write_div, ...) are
+    unique on the view page, so the long #container > section > ...
+    chains are not needed."""
+    tree = HTMLParser(html)
+
+    # Written date of the article
+    date_node = tree.css_first(SEL_DATE)
+    if date_node is None:
+        logger.info(f"Article {gall_no} deleted. Skipping...")
+        return None
+    date = parse_date(date_node.text())
+    if date is None:
+        logger.error(f"Failed to parse date for article {gall_no}. Skipping...")
+        return None
+
+    # header of the article. e.g. [일반]
+    header_node = tree.css_first(SEL_HEADER)
+    if header_node is not None:
+        article_header = header_node.text().strip('[]')
+    else:
+        article_header = ""
+
+    # title of the article
+    title = tree.css_first(SEL_TITLE).text()
+
+    content_node = tree.css_first(SEL_CONTENT)
+    if content_node is not None:
+        content = _SCRUB_RE.sub('', content_node.text()).strip()
+    else:
+        # No content in article
+        content = ""
+
+    recommend_node = tree.css_first(f'#recommend_view_up_{gall_no}')
+    recommend = recommend_node.text() if recommend_node is not None else 0
+
+    nonrecommend_node = tree.css_first(f'#recommend_view_down_{gall_no}')
+    nonrecommend = nonrecommend_node.text() if nonrecommend_node is not None else 0
+
+    view_count = tree.css_first(SEL_VIEW_COUNT).text().rsplit(' ', 1)[-1]
+
+    return ArticleExceptComment(
+        gall_no=gall_no,
+        date=date,
+        header=article_header,
+        title=title,
+        content=content,
+        view_count=view_count,
+        recommend_count=recommend,
+        nonrecommend_count=nonrecommend
+    )
+
+
+def _parse_article_bs4(gall_no: int, html: Union[str, bytes]) -> Optional[ArticleExceptComment]:
+    """BeautifulSoup fallback implementation of parse_article_html."""
+    soup = BeautifulSoup(html, BS4_PARSER)
+
+    # Written date of the article
+    try:
+        date_text = _SS_DATE.select_one(soup).text # type: ignore
+        date = parse_date(date_text)
+        if date is None:
+            logger.error(f"Failed to parse date for article {gall_no}. Skipping...")
+            return None
+    except AttributeError:
+        logger.info(f"Article {gall_no} deleted. Skipping...")
+        return None
+
+    # header of the article. e.g. [일반]
+    try:
+        article_header = _SS_HEADER.select_one(soup).text.strip('[]') # type: ignore
+    except AttributeError:
+        article_header = ""
+
+    # title of the article
+    title = _SS_TITLE.select_one(soup).text # type: ignore
+
+    try:
+        content = _SCRUB_RE.sub('', _SS_CONTENT.select_one(soup).text).strip() # type: ignore
+    except AttributeError:
+        # No content in article
+        content = ""
+
+    # id lookups go through the parser's id dict instead of a CSS walk
+    try:
+        recommend = soup.find(id=f'recommend_view_up_{gall_no}').text # type: ignore
+    except AttributeError:
+        recommend = 0
+
+    try:
+        nonrecommend = soup.find(id=f'recommend_view_down_{gall_no}').text # type: ignore
+    except AttributeError:
+        nonrecommend = 0
+
+    view_count = _SS_VIEW_COUNT.select_one(soup).text.rsplit(' ', 1)[-1] # type: ignore
+
+    return ArticleExceptComment(
+        gall_no=gall_no,
+        date=date,
+        header=article_header,
+        title=title,
+        content=content,
+        view_count=view_count,
+        recommend_count=recommend,
+        nonrecommend_count=nonrecommend
+    )
+
 
 """Class for processing DCInside articles"""
 class DCArticleProcessor:
@@ -82,118 +342,170 @@ class DCArticleProcessor:
                  gall_type: str, # 'main', 'minor', or 'mini'
                  gall_no: int,
                  headers: Dict[str, str],
-                 driver: webdriver.Chrome,
+                 driver: Optional[webdriver.Chrome] = None,
+                 driver_factory: Optional[Callable[[], webdriver.Chrome]] = None,
+                 session: Optional[requests.Session] = None,
                  is_crawl_comments: bool = True,
                  refresh_time_for_comment: float = 0.5) -> None:
 
         self.gallery_id = gallery_id
         self.gall_type = gall_type
         self.gall_no = gall_no
+        self.url_tmpl = make_url_template(gall_type, gallery_id)
         self.headers = headers
         if self.headers is None:
             self.headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
             }
-        
+        self.session = session
+        if self.session is None:
+            # Standalone usage: build an own session so connections are still pooled
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+
         self.refresh_time_for_comment = refresh_time_for_comment
         self.driver = driver
+        self.driver_factory = driver_factory
         self.is_crawl_comments = is_crawl_comments
-        
+        self.e_s_n_o: Optional[str] = None
+        self._metadata: Optional[ArticleExceptComment] = None
+
+    def _get_driver(self) -> Optional[webdriver.Chrome]:
+        """Return the Selenium driver, starting one lazily if a factory was given.
+
+        The comment API path handles most articles, so many runs never
+        need a browser at all."""
+        if self.driver is None and self.driver_factory is not None:
+            self.driver = self.driver_factory()
+        return self.driver
+
     def crawl_except_comment(self) -> Optional[ArticleExceptComment]:
         """Crawl article data except comments."""
         try:
-            data = requests.get(make_url_for_article(self.gall_type, self.gallery_id, self.gall_no), headers=self.headers)
+            data = request_with_backoff(self.session, 'GET', self.url_tmpl % self.gall_no, timeout=10)
         except requests.RequestException as e:
             logger.error(f"Failed to fetch article data {self.gall_no}: {e}")
             return None
-        
-        soup = BeautifulSoup(data.text, 'html.parser')
-        
-        # Written date of the article
-        try:
-            date_text = soup.select_one('#container > section > article:nth-child(3) > div.view_content_wrap > header > div > div > div.fl > span.gall_date').text # type: ignore
-            date = parse_date(date_text)
-            if date is None:
-                logger.error(f"Failed to parse date for article {self.gall_no}. Skipping...")
-                return None
-        except AttributeError:
-            logger.info(f"Article {self.gall_no} deleted. Skipping...")
+
+        # Remember the token so fetch_comments_api can reuse this page load,
+        # even when comments are only requested later (date-range mode)
+        self.e_s_n_o = extract_esno(data.content)
+
+        # Hand the raw bytes to the parser; decoding happens per extracted node
+        return parse_article_html(self.gall_no, data.content)
+
+    def fetch_metadata(self) -> Optional[ArticleExceptComment]:
+        """Fetch and parse the article metadata, cached on the instance."""
+        if self._metadata is None:
+            self._metadata = self.crawl_except_comment()
+        return self._metadata
+
+    def fetch_comments_api(self) -> Optional[List[Dict[str, Union[str, List[str]]]]]:
+        """Fetch comments through DCInside's internal AJAX endpoint.
+
+        The view page embeds an e_s_n_o token; posting it to /board/comment/
+        returns the comments as JSON, which avoids a full Selenium page load
+        per article. Returns None when the endpoint cannot be used so the
+        caller can fall back to Selenium."""
+        if self.e_s_n_o is None:
             return None
-        
-        # header of the article. e.g. [일반]
-        try:
-            article_header = soup.select_one('#container > section > article:nth-child(3) > div.view_content_wrap > header > div > h3 > span.title_headtext').text # type: ignore
-            article_header = article_header.replace('[', '').replace(']', '')
-        except AttributeError:
-            article_header = ""
-        
-        # title of the article
-        title = soup.select_one('#container > section > article:nth-child(3) > div.view_content_wrap > header > div > h3 > span.title_subject').text # type: ignore
-        
-        try:
-            content = soup.select_one('#container > section > article:nth-child(3) > div.view_content_wrap > div > div.inner.clear > div.writing_view_box > div.write_div').text # type: ignore
-            content = content.rstrip()
-            content = content.lstrip()
-            content = content.replace('- dc official App', '')
-        except AttributeError:
-            # No content in article
-            content = ""
-        
-        try:
-            recommend = soup.select_one(f'#recommend_view_up_{self.gall_no}').text # type: ignore
-        except AttributeError:
-            recommend = 0
-        
-        try:
-            nonrecommend = soup.select_one(f'#recommend_view_down_{self.gall_no}').text # type: ignore
-        except AttributeError:
-            nonrecommend = 0
-        
-        view_count = soup.select_one('#container > section > article:nth-child(3) > div.view_content_wrap > header > div > div > div.fr > span.gall_count').text.split(' ')[1] # type: ignore
-
-        return ArticleExceptComment(
-            gall_no=self.gall_no,
-            date=date,
-            header=article_header,
-            title=title,
-            content=content,
-            view_count=view_count,
-            recommend_count=recommend,
-            nonrecommend_count=nonrecommend
-        )
+
+        view_url = self.url_tmpl % self.gall_no
+        request_headers = {
+            'X-Requested-With': 'XMLHttpRequest',
+            'Referer': view_url
+        }
+
+        comments: List[Dict[str, Union[str, List[str]]]] = []
+        comment_by_no: Dict[str, Dict[str, Union[str, List[str]]]] = {}
+        seen_comment_nos = set()
+        page = 1
+
+        while True:
+            form_data = {
+                'id': self.gallery_id,
+                'no': self.gall_no,
+                'cmt_id': self.gallery_id,
+                'cmt_no': self.gall_no,
+                'e_s_n_o': self.e_s_n_o,
+                'comment_page': page,
+                'sort': 'D',
+                '_GALLTYPE_': GALLTYPE_CODE[self.gall_type]
+            }
+            try:
+                response = request_with_backoff(self.session, 'POST', COMMENT_API_URL, data=form_data, headers=request_headers, timeout=10)
+            except requests.RequestException as e:
+                logger.warning(f"Comment API request failed for article {self.gall_no}: {e}")
+                return None
+            if response.status_code != 200:
+                logger.warning(f"Comment API returned {response.status_code} for article {self.gall_no}.")
+                return None
+            try:
+                payload = response.json()
+            except ValueError:
+                logger.warning(f"Comment API returned non-JSON for article {self.gall_no}.")
+                return None
+
+            raw_comments = payload.get('comments') or []
+            new_comments = [item for item in raw_comments if str(item.get('no')) not in seen_comment_nos]
+            if not new_comments:
+                break
+
+            for item in new_comments:
+                seen_comment_nos.add(str(item.get('no')))
+
+                text = _TAG_RE.sub('', str(item.get('memo', ''))).strip()
+                if text == "":
+                    # Comment is dccon or image, skip it
+                    continue
+                text = _SCRUB_RE.sub('', text).strip()
+
+                parent_no = str(item.get('parent') or '0')
+                if parent_no == '0':
+                    comment = {"text": text, "replies": []}
+                    comments.append(comment)
+                    comment_by_no[str(item.get('no'))] = comment
+                else:
+                    parent_comment = comment_by_no.get(parent_no)
+                    if parent_comment is not None:
+                        parent_comment["replies"].append(text)
+            page += 1
+
+        return comments
     
     def crawl_comments(self) -> Optional[List[Dict[str, Union[str, List[str]]]]]:
-        """Crawl comments from the article."""
-        url = make_url_for_article(self.gall_type, self.gallery_id, self.gall_no)
+        """Crawl comments from the article with Selenium.
+
+        Fallback path for when fetch_comments_api cannot be used."""
+        driver = self._get_driver()
+        if driver is None:
+            logger.error(f"No Selenium driver available for article {self.gall_no}.")
+            return None
+
+        url = self.url_tmpl % self.gall_no
 
         max_attempt = 5
         for i in range(1, max_attempt):
             try:
-                self.driver.get(url)
+                driver.get(url)
                 break
             except TimeoutException:
                 logger.warning(f"Failed to get url. Retrying... ({i} / {max_attempt})")
-        
+
+        # Wait on a MutationObserver that fires as soon as a comment node
+        # lands in the DOM; no fixed-interval polling, no full refresh
+        wait_ms = int(max(self.refresh_time_for_comment, 2.0) * 1000)
+        driver.set_script_timeout(wait_ms / 1000 + 1)
         try:
-            WebDriverWait(self.driver, self.refresh_time_for_comment).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "ul.cmt_list li[id^='comment_li_'] p.usertxt.ub-word"))
-            )
-        except TimeoutException:
-            # Try to refresh the page if comments are not loaded
-            # There are two cases:
-            # 1. Comments are not loaded yet
-            # 2. There are no comments in article
-            try:
-                self.driver.refresh()
-                WebDriverWait(self.driver, self.refresh_time_for_comment).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "ul.cmt_list li[id^='comment_li_'] p.usertxt.ub-word"))
-                )
-            except TimeoutException:
-                # Assume no comments in article
-                logger.info(f"No comments found in article {self.gall_no}.")
-                return []
-        
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            has_comments = driver.execute_async_script(_COMMENT_WAIT_JS, wait_ms)
+        except WebDriverException:
+            has_comments = False
+        if not has_comments:
+            # Assume no comments in article
+            logger.info(f"No comments found in article {self.gall_no}.")
+            return []
+
+        soup = BeautifulSoup(driver.page_source, BS4_PARSER)
         
         comments = []
         
@@ -206,7 +518,7 @@ class DCArticleProcessor:
                 if text == "":
                     # Comment is dccon or image, skip it
                     continue
-                text = text.replace('- dc official App', '')
+                text = _SCRUB_RE.sub('', text).strip()
 
                 next_li = top_li.find_next_sibling("li")
                 replies = []
@@ -220,7 +532,7 @@ class DCArticleProcessor:
                             if rtext == "":
                                 # Reply is dccon or image, skip it
                                 continue
-                            rtext = rtext.replace('- dc official App', '')
+                            rtext = _SCRUB_RE.sub('', rtext).strip()
                             replies.append(rtext)
 
                 comments.append({
@@ -232,22 +544,42 @@ class DCArticleProcessor:
             logger.error(f"Error while parsing comments: {e}")
             return None
     
+    def attach_comments(self, article_meta: ArticleExceptComment) -> Optional[ArticleData]:
+        """Build ArticleData from already fetched metadata plus comments.
+
+        Does not refetch the article page: the e_s_n_o token captured
+        during fetch_metadata drives the comment API directly."""
+        comments = self.fetch_comments_api()
+        if comments is None:
+            # API path unavailable, fall back to Selenium
+            comments = self.crawl_comments()
+        if comments is None:
+            # Error occurred while crawling comments
+            # If there are no comments, comments = []
+            return None
+
+        return ArticleData(
+            gall_no=article_meta.gall_no,
+            date=article_meta.date,
+            header=article_meta.header,
+            title=article_meta.title,
+            content=article_meta.content,
+            view_count=article_meta.view_count,
+            recommend_count=article_meta.recommend_count,
+            nonrecommend_count=article_meta.nonrecommend_count,
+            comments=comments
+        )
+
     def process_article(self) -> Optional[ArticleData]:
         """Process the article and return ArticleData."""
-        article_data = self.crawl_except_comment()
+        article_data = self.fetch_metadata()
         if article_data is None:
             # Error occurred while crawling article data
             return None
 
         if self.is_crawl_comments is True:
-            comments = self.crawl_comments()
-            if comments is None:
-                # Error occurred while crawling comments
-                # If there are no comments, comments = []
-                return None
-        else:
-            comments = []
-        
+            return self.attach_comments(article_data)
+
         return ArticleData(
             gall_no=article_data.gall_no,
             date=article_data.date,
@@ -257,5 +589,5 @@ class DCArticleProcessor:
             view_count=article_data.view_count,
             recommend_count=article_data.recommend_count,
             nonrecommend_count=article_data.nonrecommend_count,
-            comments=comments
+            comments=[]
         )